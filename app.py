@@ -1,6 +1,10 @@
 import streamlit as st
 import pandas as pd
+import pyarrow as pa
+import io
 import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import sys
 import logging
@@ -29,18 +33,65 @@ if 'scraped_data' not in st.session_state:
     st.session_state.scraped_data = {}
 if 'cleaned_data' not in st.session_state:
     st.session_state.cleaned_data = None
+    st.session_state.data_version = None
 if 'uploaded_data' not in st.session_state:
     st.session_state.uploaded_data = None
+if 'pending_writes' not in st.session_state:
+    st.session_state.pending_writes = []
+
+def set_cleaned_data(df: pd.DataFrame):
+    """Enregistre le jeu nettoyé avec un jeton de version unique (clé du cache du dashboard)"""
+    st.session_state.cleaned_data = df
+    st.session_state.data_version = uuid.uuid4().hex
+
+def to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """Sérialise en CSV UTF-8 avec BOM directement dans un tampon binaire"""
+    buffer = io.BytesIO()
+    buffer.write(b'\xef\xbb\xbf')
+    df.to_csv(buffer, index=False, encoding='utf-8')
+    return buffer.getvalue()
+
+def write_dataframe(df: pd.DataFrame, filename: str) -> str:
+    """Écrit le DataFrame dans le format indiqué par l'extension et renvoie le fichier écrit"""
+    try:
+        if filename.endswith('.parquet'):
+            df.to_parquet(filename, compression='snappy', index=False)
+            return filename
+        if filename.endswith('.feather'):
+            df.reset_index(drop=True).to_feather(filename)
+            return filename
+    except (pa.ArrowTypeError, pa.ArrowInvalid) as e:
+        # Colonnes aux types mélangés (imports Excel/Web Scraper): Arrow refuse, le CSV accepte
+        logger.warning(f"Sauvegarde Arrow impossible pour {filename} ({e}), repli sur CSV")
+        if os.path.exists(filename):
+            os.remove(filename)
+        filename = os.path.splitext(filename)[0] + '.csv'
+    
+    df.to_csv(filename, index=False)
+    return filename
+
+@st.cache_resource
+def get_io_pool() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=2)
+
+@st.cache_resource
+def get_scraper() -> DakarAutoScraper:
+    return DakarAutoScraper()
+
+@st.cache_resource
+def get_cleaner() -> DataCleaner:
+    return DataCleaner()
 
 class DakarAutoApp:
    
     
     def __init__(self):
-        self.scraper = DakarAutoScraper()
-        self.cleaner = DataCleaner()
+        self.scraper = get_scraper()
+        self.cleaner = get_cleaner()
     
     def run(self):
         
+        self.collect_pending_writes()
         self.render_sidebar()
         
         
@@ -91,13 +142,21 @@ class DakarAutoApp:
             
             st.markdown("---")
             
+            st.radio(
+                "Format de sauvegarde:",
+                ["parquet", "feather", "csv"],
+                key="save_format",
+                horizontal=True,
+                help="Parquet et Feather sont plus rapides à écrire et plus compacts que le CSV"
+            )
+            
             
             if st.session_state.cleaned_data is not None:
                 self.download_data_button()
     
     def download_data_button(self):
         if st.session_state.cleaned_data is not None:
-            csv_data = st.session_state.cleaned_data.to_csv(index=False).encode('utf-8-sig')
+            csv_data = to_csv_bytes(st.session_state.cleaned_data)
             
             st.download_button(
                 label=" Télécharger données nettoyées",
@@ -107,6 +166,36 @@ class DakarAutoApp:
                 use_container_width=True
             )
     
+    def save_dataframe(self, df: pd.DataFrame, basename: str, background: bool = False) -> str:
+        """Sauvegarde sur disque dans le format choisi et renvoie le nom du fichier"""
+        save_format = st.session_state.get('save_format', 'parquet')
+        filename = f"{basename}.{save_format}"
+        
+        if background:
+            future = get_io_pool().submit(write_dataframe, df, filename)
+            st.session_state.pending_writes.append((filename, future))
+            return filename
+        
+        written = write_dataframe(df, filename)
+        if written != filename:
+            st.warning(f"Format {save_format} impossible pour ces données: sauvegardé en CSV")
+        return written
+    
+    def collect_pending_writes(self):
+        """Journalise les sauvegardes en arrière-plan terminées depuis le dernier rerun"""
+        pending = []
+        for filename, future in st.session_state.pending_writes:
+            if not future.done():
+                pending.append((filename, future))
+            elif future.exception() is not None:
+                logger.error(f"Erreur lors de la sauvegarde de {filename}: {future.exception()}")
+                st.error(f"Erreur lors de la sauvegarde de {filename}: {future.exception()}")
+            elif future.result() != filename:
+                st.warning(f"{filename}: format impossible pour ces données, sauvegardé en CSV ({future.result()})")
+            else:
+                logger.info(f"Fichier sauvegardé: {filename}")
+        st.session_state.pending_writes = pending
+    
     def render_scraper_page(self):
         
         st.header("Scraper en direct")
@@ -146,12 +235,6 @@ class DakarAutoApp:
     
     def perform_scraping(self, categories, pages, save_raw, auto_clean):
         
-        category_urls = {
-            "Voitures": "https://dakar-auto.com/senegal/voitures-4",
-            "Motos": "https://dakar-auto.com/senegal/motos-and-scooters-3",
-            "Location": "https://dakar-auto.com/senegal/location-de-voitures-19"
-        }
-        
         category_keys = {
             "Voitures": "voitures",
             "Motos": "motos",
@@ -161,33 +244,36 @@ class DakarAutoApp:
         progress_bar = st.progress(0)
         status_text = st.empty()
         
-        scraped_data = {}
-        total_categories = len(categories)
+        status_text.text(f"Scraping {', '.join(categories)}...")
         
-        for i, category in enumerate(categories):
-            status_text.text(f"Scraping {category}...")
+        # Une seule boucle asyncio pour toutes les catégories: session, connexions et
+        # débit maximal partagés, le site ne voit pas plus de requêtes qu'avec une catégorie
+        try:
+            results = self.scraper.scrape_all_categories(
+                pages, [category_keys[category] for category in categories]
+            )
+        except Exception as e:
+            st.error(f"Erreur lors du scraping: {str(e)}")
+            results = {}
+        
+        progress_bar.progress(1.0)
+        status_text.text(f"Scraping terminé ({len(results)}/{len(categories)} catégories)")
+        
+        scraped_data = {}
+        for category in categories:
+            df = results.get(category_keys[category])
+            if df is None:
+                continue
+            scraped_data[category] = df
+            
             
-            try:
-                df = self.scraper.scrape_category(
-                    category_urls[category],
-                    category_keys[category],
-                    pages
+            if save_raw:
+                filename = self.save_dataframe(
+                    df,
+                    f"{category_keys[category]}_{datetime.now().strftime('%Y%m%d')}",
+                    background=True
                 )
-                
-                if not df.empty:
-                    scraped_data[category] = df
-                    
-                    
-                    if save_raw:
-                        filename = f"{category_keys[category]}_{datetime.now().strftime('%Y%m%d')}.csv"
-                        df.to_csv(filename, index=False)
-                        logger.info(f"Données brutes sauvegardées: {filename}")
-                
-                progress_bar.progress((i + 1) / total_categories)
-                
-            except Exception as e:
-                st.error(f"Erreur lors du scraping de {category}: {str(e)}")
-                continue
+                logger.info(f"Sauvegarde des données brutes lancée: {filename}")
         
         if scraped_data:
             st.session_state.scraped_data = scraped_data
@@ -196,14 +282,17 @@ class DakarAutoApp:
             if auto_clean:
                 cleaned_df = self.cleaner.merge_categories(scraped_data)
                 cleaned_df = self.cleaner.clean_dataframe(cleaned_df, 'scraper')
-                st.session_state.cleaned_data = cleaned_df
+                set_cleaned_data(cleaned_df)
                 
                 
-                cleaned_filename = f"cleaned_{datetime.now().strftime('%Y%m%d_%H%M')}.csv"
-                cleaned_df.to_csv(cleaned_filename, index=False)
+                cleaned_filename = self.save_dataframe(
+                    cleaned_df,
+                    f"cleaned_{datetime.now().strftime('%Y%m%d_%H%M')}",
+                    background=True
+                )
                 
                 st.success(f" {sum(len(df) for df in scraped_data.values())} annonces scrapées et nettoyées!")
-                st.info(f" Données nettoyées sauvegardées: {cleaned_filename}")
+                st.info(f" Sauvegarde des données nettoyées en arrière-plan: {cleaned_filename}")
             else:
                 st.success(f" {sum(len(df) for df in scraped_data.values())} annonces scrapées!")
         
@@ -219,8 +308,8 @@ class DakarAutoApp:
             st.subheader("Import depuis Web Scraper")
             
             uploaded_file = st.file_uploader(
-                "Choisissez un fichier CSV/Excel",
-                type=['csv', 'xlsx', 'xls'],
+                "Choisissez un fichier CSV/Excel/Parquet/Feather",
+                type=['csv', 'xlsx', 'xls', 'parquet', 'feather'],
                 help="Importez vos données exportées depuis Web Scraper"
             )
             
@@ -229,6 +318,10 @@ class DakarAutoApp:
                    
                     if uploaded_file.name.endswith('.csv'):
                         df = pd.read_csv(uploaded_file)
+                    elif uploaded_file.name.endswith('.parquet'):
+                        df = pd.read_parquet(uploaded_file)
+                    elif uploaded_file.name.endswith('.feather'):
+                        df = pd.read_feather(uploaded_file)
                     else:
                         df = pd.read_excel(uploaded_file)
                     
@@ -261,14 +354,18 @@ class DakarAutoApp:
                             'webscraper'
                         )
                         
-                        st.session_state.cleaned_data = df_clean
-                        
+                        set_cleaned_data(df_clean)
                         
-                        filename = f"webscraper_cleaned_{datetime.now().strftime('%Y%m%d_%H%M')}.csv"
-                        df_clean.to_csv(filename, index=False)
                         
                         st.success(f" Données nettoyées: {len(df_clean)} lignes")
-                        st.info(f" Fichier sauvegardé: {filename}")
+                        
+                        try:
+                            filename = self.save_dataframe(
+                                df_clean, f"webscraper_cleaned_{datetime.now().strftime('%Y%m%d_%H%M')}"
+                            )
+                            st.info(f" Fichier sauvegardé: {filename}")
+                        except Exception as e:
+                            st.error(f"Erreur lors de la sauvegarde: {str(e)}")
                         
                         
                         col1, col2 = st.columns(2)
@@ -284,7 +381,7 @@ class DakarAutoApp:
             st.info("Veuillez d'abord scraper ou importer des données")
             return
         
-        visualizer = DashboardVisualizer(st.session_state.cleaned_data)
+        visualizer = DashboardVisualizer(st.session_state.cleaned_data, st.session_state.data_version)
         visualizer.create_full_dashboard()
     
     def render_data_viewer(self):
@@ -325,7 +422,7 @@ class DakarAutoApp:
         with col2:
             st.metric("Colonnes", len(df_to_display.columns))
         with col3:
-            missing = df_to_display.isnull().sum().sum()
+            missing = int(df_to_display.isna().to_numpy().sum())
             st.metric("Valeurs manquantes", missing)
         with col4:
             if 'prix' in df_to_display.columns:
@@ -375,7 +472,7 @@ class DakarAutoApp:
             }
         )
         
-        csv_data = df_to_display.to_csv(index=False).encode('utf-8-sig')
+        csv_data = to_csv_bytes(df_to_display)
         st.download_button(
             label=" Télécharger ces données",
             data=csv_data,
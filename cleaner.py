@@ -1,47 +1,84 @@
 import pandas as pd
 import numpy as np
 import re
-from typing import Optional, Dict 
+from typing import Dict 
 import logging
 
 logger = logging.getLogger(__name__)
 
+def to_nullable_int(values: pd.Series, dtype: str = 'Int64') -> pd.Series:
+    """Convertit en entier nullable `dtype`; valeurs non numériques ou hors bornes -> NA
+    
+    Des chiffres parasites (numéros de téléphone dans un prix...) ne font ainsi pas
+    échouer le cast de toute la colonne.
+    """
+    numeric = pd.to_numeric(values, errors='coerce')
+    bounds = np.iinfo(dtype.lower())
+    # Borne haute exclusive: en float, iinfo.max peut s'arrondir à max + 1
+    in_range = (numeric >= bounds.min) & (numeric < bounds.max + 1)
+    return numeric.where(in_range).round().astype(dtype)
+
 class DataCleaner:
     
+    marque_mapping = {
+        'peugeot': 'Peugeot',
+        'renault': 'Renault',
+        'toyota': 'Toyota',
+        'hyundai': 'Hyundai',
+        'ford': 'Ford',
+        'bmw': 'BMW',
+        'kia': 'Kia',
+        'land rover': 'Land Rover',
+        'jeep': 'Jeep',
+        'citroen': 'Citroën',
+        'mazda': 'Mazda',
+        'mitsubishi': 'Mitsubishi',
+        'honda': 'Honda',
+        'yamaha': 'Yamaha',
+        'suzuki': 'Suzuki',
+        'sym': 'SYM',
+        'ktm': 'KTM',
+        'piaggio': 'Piaggio',
+        'haouju': 'Haouju'
+    }
+    
+    # Types fixes (pas de downcast selon les données): même schéma Parquet d'une exécution à l'autre
+    int_dtypes = {
+        'prix': 'UInt32',
+        'kilometrage': 'UInt32',
+        'annee': 'Int16'
+    }
+    
     def __init__(self):
-        self.marque_mapping = {
-            'peugeot': 'Peugeot',
-            'renault': 'Renault',
-            'toyota': 'Toyota',
-            'hyundai': 'Hyundai',
-            'ford': 'Ford',
-            'bmw': 'BMW',
-            'kia': 'Kia',
-            'land rover': 'Land Rover',
-            'jeep': 'Jeep',
-            'citroen': 'Citroën',
-            'mazda': 'Mazda',
-            'mitsubishi': 'Mitsubishi',
-            'honda': 'Honda',
-            'yamaha': 'Yamaha',
-            'suzuki': 'Suzuki',
-            'sym': 'SYM',
-            'ktm': 'KTM',
-            'piaggio': 'Piaggio',
-            'haouju': 'Haouju'
-        }
+        self._non_digit = re.compile(r'\D')
+        self._year_re = re.compile(r'\b((?:19|20)\d{2})\b')
+        self._year_token_re = re.compile(r'(?<!\S)(?:19|20)\d{2}(?!\S)')
+        self._spaces_re = re.compile(r'\s+')
+        
+        cities = ['Dakar', 'Thiès', 'Saint-Louis', 'Ziguinchor', 'Kaolack', 
+                  'Mbour', 'Diourbel', 'Louga', 'Tambacounda', 'Kolda', 
+                  'Matam', 'Kaffrine', 'Sédhiou', 'Rufisque', 'Guédiawaye']
+        self._city_names = {city.lower(): city for city in cities}
+        self._city_re = re.compile(
+            '(' + '|'.join(re.escape(city) for city in cities) + ')',
+            re.IGNORECASE
+        )
     
     def clean_dataframe(self, df: pd.DataFrame, source: str = 'scraper') -> pd.DataFrame:
-        
+        """Nettoie les données sans copie préalable.
+
+        Pour source='scraper', les colonnes de `df` sont modifiées en place:
+        l'appelant ne doit plus utiliser `df` ensuite (c'est le cas du DataFrame
+        renvoyé par merge_categories). Pour 'webscraper', le renommage des
+        colonnes crée déjà un nouveau DataFrame et `df` reste intact.
+        """
         if df.empty:
             return df
-        
-        df_clean = df.copy()
-        
+
         if source == 'webscraper':
-            df_clean = self._clean_webscraper_data(df_clean)
+            df_clean = self._clean_webscraper_data(df)
         else:
-            df_clean = self._clean_scraper_data(df_clean)
+            df_clean = self._clean_scraper_data(df)
         
         
         df_clean = self._common_cleaning(df_clean)
@@ -52,21 +89,24 @@ class DataCleaner:
     def _clean_scraper_data(self, df: pd.DataFrame) -> pd.DataFrame:
         
        
-        numeric_cols = ['prix', 'kilometrage', 'annee']
-        for col in numeric_cols:
+        for col, dtype in self.int_dtypes.items():
             if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
-        
+                # Hors bornes (négatif, > 2**32...) -> NA au lieu d'une erreur de cast
+                df[col] = to_nullable_int(df[col], dtype)
+
         
         if 'marque' in df.columns:
-            df['marque'] = df['marque'].str.lower()
-            df['marque'] = df['marque'].map(self.marque_mapping).fillna(df['marque'].str.title())
+            marques = df['marque'].astype('category')
+            lowered = marques.cat.categories.to_series().str.lower()
+            standardized = lowered.map(self.marque_mapping).fillna(lowered.str.title())
+            # Plusieurs graphies peuvent donner la même marque: on mappe les catégories, pas les lignes
+            df['marque'] = marques.map(standardized)
         
         
         if 'adresse' in df.columns:
             df['adresse'] = df['adresse'].str.strip()
            
-            df['ville'] = df['adresse'].apply(self._extract_city)
+            df['ville'] = self._extract_city(df['adresse'])
         
         return df
     
@@ -84,9 +124,7 @@ class DataCleaner:
         }
         
        
-        for old_col, new_col in column_mapping.items():
-            if old_col in df.columns:
-                df = df.rename(columns={old_col: new_col})
+        df = df.rename(columns=column_mapping)
         
         
         if 'titre_complet' not in df.columns and 'marque' in df.columns:
@@ -96,98 +134,92 @@ class DataCleaner:
         
         
         if 'prix_texte' in df.columns:
-            df['prix'] = df['prix_texte'].apply(self._extract_numeric_price)
+            prices = df['prix_texte']
+            # Un import Excel/Parquet peut déjà avoir une colonne Prix numérique, ou mélangée:
+            # les valeurs déjà numériques sont gardées, seuls les textes sont réduits aux chiffres
+            if not pd.api.types.is_numeric_dtype(prices):
+                digits = prices.astype('string').str.replace(self._non_digit, '', regex=True)
+                prices = pd.to_numeric(prices, errors='coerce').fillna(pd.to_numeric(digits, errors='coerce'))
+            df['prix'] = to_nullable_int(prices)
         
         
         return self._clean_scraper_data(df)
     
     def _split_combined_title(self, df: pd.DataFrame) -> pd.DataFrame:
-       
-        def split_title(title):
-            if not isinstance(title, str):
-                return pd.Series([None, None, None])
-            
-            
-            year_match = re.search(r'\b(19|20)\d{2}\b', title)
-            year = year_match.group(0) if year_match else None
-            
-           
-            parts = title.split()
-            marque = parts[0] if parts else None
-            
-            
-            if year and year in parts:
-                parts.remove(year)
-            if marque and marque in parts:
-                parts.remove(marque)
-            modele = ' '.join(parts) if parts else None
-            
-            return pd.Series([marque, modele, year])
-        
+
         if 'marque' in df.columns:
-            df[['marque', 'modele', 'annee']] = df['marque'].apply(split_title)
-        
+            # Colonne entièrement vide à l'import CSV: float64, sans accesseur .str
+            titles = df['marque'].astype('string')
+            df['annee'] = titles.str.extract(self._year_re, expand=False)
+
+
+            # Seule la première année est retirée (comme l'année extraite), puis les espaces
+            # laissés par le retrait sont fusionnés
+            without_year = (titles.str.replace(self._year_token_re, '', n=1, regex=True)
+                                  .str.replace(self._spaces_re, ' ', regex=True)
+                                  .str.strip())
+            parts = without_year.str.split(n=1, expand=True).reindex(columns=[0, 1])
+            df['marque'] = parts[0]
+            df['modele'] = parts[1]
+
         return df
     
-    def _extract_numeric_price(self, price_text: str) -> Optional[int]:
-        
-        if not isinstance(price_text, str):
-            return None
+    def _extract_city(self, addresses: pd.Series) -> pd.Series:
         
-        cleaned = re.sub(r'[^\d]', '', price_text)
-        return int(cleaned) if cleaned else None
-    
-    def _extract_city(self, address: str) -> Optional[str]:
-        if not isinstance(address, str):
-            return None
-        
-        cities = ['Dakar', 'Thiès', 'Saint-Louis', 'Ziguinchor', 'Kaolack', 
-                 'Mbour', 'Diourbel', 'Louga', 'Tambacounda', 'Kolda', 
-                 'Matam', 'Kaffrine', 'Sédhiou', 'Rufisque', 'Guédiawaye']
+        extracted = addresses.str.extract(self._city_re, expand=False)
+        cities = extracted.str.lower().map(self._city_names)
         
-        for city in cities:
-            if city.lower() in address.lower():
-                return city
         
-        if ',' in address:
-            parts = address.split(',')
-            if len(parts) > 1:
-                return parts[-1].strip()
+        last_part = addresses.str.rsplit(',', n=1).str[-1].str.strip()
+        fallback = last_part.where(addresses.str.contains(',', regex=False, na=False))
         
-        return None
+        return cities.where(extracted.notna(), fallback)
     
     def _common_cleaning(self, df: pd.DataFrame) -> pd.DataFrame:
-        df = df.drop_duplicates(subset=['titre_complet', 'prix'], keep='first')
-        
+        if 'titre_complet' in df.columns and 'prix' in df.columns:
+            row_hash = pd.util.hash_pandas_object(df[['titre_complet', 'prix']], index=False)
+            df = df.loc[~row_hash.duplicated()]
+
        
         if 'prix' in df.columns:
-            df = df[df['prix'].notna()]
-            
-            if len(df) > 0:
-                q1 = df['prix'].quantile(0.05)
-                q3 = df['prix'].quantile(0.95)
-                df = df[(df['prix'] >= q1) & (df['prix'] <= q3)]
+            prices = df['prix'].to_numpy(dtype='float64', na_value=np.nan)
+            mask = ~np.isnan(prices)
+
+            # Sous 20 prix, couper 5% de chaque côté n'a pas de sens: bornes = min/max
+            if np.count_nonzero(mask) >= 20:
+                q1, q3 = np.percentile(prices[mask], [5, 95])
+                mask &= (prices >= q1) & (prices <= q3)
+
+            df = df[mask]
         
        
         text_cols = ['adresse', 'boite_vitesse', 'carburant', 'ville', 'modele']
         for col in text_cols:
             if col in df.columns:
-                df[col] = df[col].fillna('Non spécifié')
-        
+                values = df[col]
+                # Les colonnes catégorielles du scraper doivent connaître la valeur de remplissage
+                if isinstance(values.dtype, pd.CategoricalDtype) and 'Non spécifié' not in values.cat.categories:
+                    values = values.cat.add_categories('Non spécifié')
+                df[col] = values.fillna('Non spécifié')
+
+
+        category_cols = ['marque', 'categorie', 'ville', 'boite_vitesse', 'carburant']
+        for col in category_cols:
+            if col in df.columns:
+                df[col] = df[col].astype('category').cat.remove_unused_categories()
+
         return df
     
     def merge_categories(self, data_dict: Dict[str, pd.DataFrame]) -> pd.DataFrame:
         if not data_dict:
             return pd.DataFrame()
         
-        all_dfs = []
-        for category, df in data_dict.items():
-            if not df.empty:
-                df['categorie'] = category
-                all_dfs.append(df)
+        frames = {category: df for category, df in data_dict.items() if not df.empty}
         
-        if all_dfs:
-            merged_df = pd.concat(all_dfs, ignore_index=True)
+        if frames:
+            # Les DataFrames sources ne sont pas modifiés: ils peuvent encore être en cours d'écriture
+            merged_df = pd.concat(frames.values(), ignore_index=True)
+            merged_df['categorie'] = np.repeat(list(frames), [len(df) for df in frames.values()])
             return merged_df
         
         return pd.DataFrame()
\ No newline at end of file
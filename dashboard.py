@@ -6,10 +6,57 @@ import streamlit as st
 import numpy as np
 from typing import Optional
 
+
+# Clé de cache = jeton de version des données, renouvelé par l'app à chaque nouveau jeu
+# nettoyé: le DataFrame (préfixe _) n'est pas haché, hacher tout le contenu coûterait
+# aussi cher que l'agrégation elle-même
+_cache_aggregation = st.cache_data(ttl=24 * 60 * 60, max_entries=16)
+
+
+@_cache_aggregation
+def _summary_stats(_df: pd.DataFrame, version: str) -> dict:
+    return {
+        'total': len(_df),
+        'avg_price': _df['prix'].mean() if 'prix' in _df.columns else None,
+        'brands': _df['marque'].nunique() if 'marque' in _df.columns else None,
+        'categories': _df['categorie'].nunique() if 'categorie' in _df.columns else None,
+    }
+
+
+@_cache_aggregation
+def _brand_counts(_df: pd.DataFrame, version: str) -> pd.Series:
+    return _df['marque'].value_counts().head(10)
+
+
+@_cache_aggregation
+def _category_counts(_df: pd.DataFrame, version: str) -> pd.Series:
+    return _df['categorie'].value_counts()
+
+
+@_cache_aggregation
+def _price_by_year(_df: pd.DataFrame, version: str) -> pd.DataFrame:
+    # Projection sur les deux colonnes utiles au lieu de copier tout le DataFrame
+    valid_years = _df.loc[_df['annee'].notna(), ['annee', 'prix']]
+    valid_years = valid_years.assign(annee=valid_years['annee'].astype('int32'))
+    return valid_years.groupby('annee', sort=True, observed=True)['prix'].agg(['mean', 'count']).reset_index()
+
+
+@_cache_aggregation
+def _city_counts(_df: pd.DataFrame, version: str) -> pd.Series:
+    return _df['ville'].value_counts().head(15)
+
+
+@_cache_aggregation
+def _corr_matrix(_numeric_view: pd.DataFrame, version: str) -> pd.DataFrame:
+    return _numeric_view.corr()
+
+
 class DashboardVisualizer:
     
-    def __init__(self, data: pd.DataFrame):
+    def __init__(self, data: pd.DataFrame, version: str):
         self.data = data
+        self.version = version
+        self._numeric_view = data.select_dtypes(include=[np.number])
         self.color_palette = px.colors.qualitative.Set3
     
     def create_summary_cards(self) -> None:
@@ -17,26 +64,23 @@ class DashboardVisualizer:
             st.warning("Aucune donnée disponible pour le dashboard")
             return
         
+        stats = _summary_stats(self.data, self.version)
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            total_ads = len(self.data)
-            st.metric("Total annonces", f"{total_ads:,}")
+            st.metric("Total annonces", f"{stats['total']:,}")
         
         with col2:
-            if 'prix' in self.data.columns:
-                avg_price = self.data['prix'].mean()
-                st.metric("Prix moyen", f"{avg_price:,.0f} F CFA")
+            if stats['avg_price'] is not None:
+                st.metric("Prix moyen", f"{stats['avg_price']:,.0f} F CFA")
         
         with col3:
-            if 'marque' in self.data.columns:
-                unique_brands = self.data['marque'].nunique()
-                st.metric("Marques", unique_brands)
+            if stats['brands'] is not None:
+                st.metric("Marques", stats['brands'])
         
         with col4:
-            if 'categorie' in self.data.columns:
-                categories = self.data['categorie'].nunique()
-                st.metric("Catégories", categories)
+            if stats['categories'] is not None:
+                st.metric("Catégories", stats['categories'])
     
     def create_price_distribution(self) -> None:
         """Distribution des prix"""
@@ -70,7 +114,7 @@ class DashboardVisualizer:
         
         st.subheader(" Top 10 des marques")
         
-        brand_counts = self.data['marque'].value_counts().head(10)
+        brand_counts = _brand_counts(self.data, self.version)
         
         fig = px.bar(
             x=brand_counts.values,
@@ -92,7 +136,7 @@ class DashboardVisualizer:
         
         st.subheader(" Répartition par catégorie")
         
-        cat_counts = self.data['categorie'].value_counts()
+        cat_counts = _category_counts(self.data, self.version)
         
         fig = px.pie(
             values=cat_counts.values,
@@ -112,15 +156,12 @@ class DashboardVisualizer:
         st.subheader(" Analyse par année")
         
        
-        valid_years = self.data[self.data['annee'].notna()].copy()
-        valid_years['annee'] = valid_years['annee'].astype(int)
+        price_by_year = _price_by_year(self.data, self.version)
         
-        if len(valid_years) == 0:
+        if len(price_by_year) == 0:
             return
         
        
-        price_by_year = valid_years.groupby('annee')['prix'].agg(['mean', 'count']).reset_index()
-       
         fig = make_subplots(specs=[[{"secondary_y": True}]])
         
        
@@ -163,7 +204,7 @@ class DashboardVisualizer:
         
         st.subheader(" Distribution géographique")
         
-        city_counts = self.data['ville'].value_counts().head(15)
+        city_counts = _city_counts(self.data, self.version)
         
         fig = px.bar(
             x=city_counts.index,
@@ -184,10 +225,8 @@ class DashboardVisualizer:
         st.subheader(" Corrélations entre variables")
         
         
-        numeric_cols = self.data.select_dtypes(include=[np.number]).columns.tolist()
-        
-        if len(numeric_cols) >= 2:
-            corr_matrix = self.data[numeric_cols].corr()
+        if self._numeric_view.shape[1] >= 2:
+            corr_matrix = _corr_matrix(self._numeric_view, self.version)
             
             fig = px.imshow(
                 corr_matrix,
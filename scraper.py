@@ -1,23 +1,334 @@
-import requests
-from bs4 import BeautifulSoup
+import asyncio
+import atexit
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import ahocorasick
+import aiohttp
+from aiolimiter import AsyncLimiter
+from aiohttp_client_cache import CachedSession as AsyncCachedSession, SQLiteBackend
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry, make_headers
+from bs4 import BeautifulSoup, FeatureNotFound
+import numpy as np
 import pandas as pd
 import re
 import time
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import logging
 
+from cleaner import to_nullable_int
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Colonnes produites pour chaque annonce, dans l'ordre des tuples renvoyés par _extract_listing_data
+_FIELDS = (
+    'titre_complet', 'marque', 'annee', 'modele', 'prix_texte', 'prix',
+    'adresse', 'kilometrage', 'boite_vitesse', 'carburant', 'url_page'
+)
+# Cache HTTP sur disque (SQLite): une relance ne retélécharge pas les pages encore fraîches
+_CACHE_NAME = 'dakar_cache'
+_CACHE_EXPIRE = 3600
+# Politesse envers le site: au plus 5 requêtes/s en asynchrone, 1 s entre deux requêtes sinon
+_ASYNC_RATE = 5
+_MIN_INTERVAL = 1.0
+# Types compacts: catégories pour les chaînes répétées, entiers nullables pour les nombres
+_CATEGORY_COLUMNS = ('marque', 'boite_vitesse', 'carburant')
+_INT_DTYPES = {
+    'annee': 'Int16',
+    'kilometrage': 'Int64',
+    'prix': 'Int64',
+}
+
+
+class _DigitsOnly(dict):
+    """Table str.translate qui ne garde que les chiffres, comme re.sub(r'[^\\d]', '', texte).
+
+    Chaque caractère n'est classé qu'une fois, au premier passage; ensuite la
+    traduction reste une simple boucle C sur la chaîne.
+    """
+    
+    def __missing__(self, code: int) -> Optional[int]:
+        value = code if chr(code).isdecimal() else None
+        self[code] = value
+        return value
+
+
+_KEEP_DIGITS = _DigitsOnly()
+
+
+# Mots-clés des détails d'une annonce -> (champ, valeur), cherchés en une seule passe
+_DETAIL_KEYWORDS = {
+    'km': ('kilometrage', None),
+    'automatique': ('boite_vitesse', 'Automatique'),
+    'manuelle': ('boite_vitesse', 'Manuelle'),
+    'diesel': ('carburant', 'Diesel'),
+    'essence': ('carburant', 'Essence'),
+}
+_DETAILS_AUTOMATON = ahocorasick.Automaton()
+for _keyword, _match in _DETAIL_KEYWORDS.items():
+    _DETAILS_AUTOMATON.add_word(_keyword, _match)
+_DETAILS_AUTOMATON.make_automaton()
+
+
+# Sélecteurs essayés dans l'ordre jusqu'à trouver au moins 3 annonces
+_LISTING_SELECTORS = (
+    'div[class*="listing"]',
+    'div[class*="card"]',
+    'article',
+    'div.col-lg-4',
+    'div.col-md-6',
+    'div:has(h2):has(h3)',
+)
+_CLASS_FALLBACK_RE = re.compile(r'listing|card|annonce|item', re.IGNORECASE)
+
+
+def _make_soup(content: bytes) -> BeautifulSoup:
+    """Parse avec lxml (C), ou html.parser si lxml n'est pas installé"""
+    try:
+        return BeautifulSoup(content, 'lxml')
+    except FeatureNotFound:
+        return BeautifulSoup(content, 'html.parser')
+
+
+class _SoupNode:
+    """Expose un noeud BeautifulSoup avec le sous-ensemble de l'API selectolax utilisé ici"""
+    
+    __slots__ = ('_node',)
+    
+    def __init__(self, node):
+        self._node = node
+    
+    @property
+    def tag(self) -> str:
+        return self._node.name or '-text'
+    
+    @property
+    def attributes(self) -> Dict[str, str]:
+        return {key: ' '.join(value) if isinstance(value, list) else value
+                for key, value in self._node.attrs.items()}
+    
+    @property
+    def next(self) -> Optional['_SoupNode']:
+        sibling = self._node.next_sibling
+        return _SoupNode(sibling) if sibling is not None else None
+    
+    @property
+    def mem_id(self) -> int:
+        return id(self._node)
+    
+    @property
+    def parent(self) -> Optional['_SoupNode']:
+        parent = self._node.parent
+        return _SoupNode(parent) if parent is not None else None
+    
+    def css(self, selector: str) -> List['_SoupNode']:
+        return [_SoupNode(node) for node in self._node.select(selector)]
+    
+    def css_first(self, selector: str) -> Optional['_SoupNode']:
+        node = self._node.select_one(selector)
+        return _SoupNode(node) if node is not None else None
+    
+    def text(self, separator: str = '', strip: bool = False) -> str:
+        return self._node.get_text(separator, strip=strip)
+
+
+def _parse_document(content: bytes):
+    """Parse avec selectolax (lexbor), ou BeautifulSoup si selectolax n'est pas installé"""
+    if LexborHTMLParser is not None:
+        return LexborHTMLParser(content)
+    return _SoupNode(_make_soup(content))
+
+
+def _find_next_within(node, tag: str, root):
+    """Premier élément `tag` qui suit `node` dans l'ordre du document, sans sortir de `root`"""
+    root_id = root.mem_id
+    while node is not None and node.mem_id != root_id:
+        sibling = node.next
+        while sibling is not None:
+            if sibling.tag == tag:
+                return sibling
+            if not sibling.tag.startswith('-'):
+                found = sibling.css_first(tag)
+                if found is not None:
+                    return found
+            sibling = sibling.next
+        node = node.parent
+    return None
+
+def _parse_html(html: bytes, category: str, url: str) -> List[Tuple]:
+    """Extrait les annonces d'une page HTML déjà téléchargée"""
+    tree = _parse_document(html)
+    
+   
+    listings = _find_listings(tree)
+    
+    data = []
+    for listing in listings:
+        listing_data = _extract_listing_data(listing, category, url)
+        if listing_data:
+            data.append(listing_data)
+    
+    return data
+
+def _find_listings(tree):
+    """Trouve tous les conteneurs d'annonces"""
+    for selector in _LISTING_SELECTORS:
+        listings = tree.css(selector)
+        if len(listings) >= 3:  
+            return listings
+    
+    
+    return [node for node in tree.css('div[class], article[class]')
+            if _CLASS_FALLBACK_RE.search(node.attributes.get('class') or '')]
+
+def _extract_listing_data(listing, category: str, url: str) -> Optional[Tuple]:
+    """Extrait les données d'une annonce, dans l'ordre de _FIELDS"""
+    try:
+        title_elem = listing.css_first('h2')
+        if not title_elem:
+            return None
+        
+        title = title_elem.text(strip=True)
+        
+       
+        marque, annee, modele = _extract_title_parts(title.split())
+        
+        
+        price_text = price = address = None
+        price_elem = listing.css_first('h3')
+        if price_elem:
+            price_text = price_elem.text(strip=True)
+            price = _extract_numeric_price(price_text)
+        
+        
+        # L'adresse est le premier <p> après le prix, cherché dans l'annonce seulement
+        address_elem = _find_next_within(price_elem, 'p', listing) if price_elem else None
+        if address_elem:
+            address = address_elem.text(strip=True)
+        
+        
+        kilometrage, boite_vitesse, carburant = _extract_details(listing, category)
+        
+        return (title, marque, annee, modele, price_text, price,
+                address, kilometrage, boite_vitesse, carburant, url)
+        
+    except Exception as e:
+        logger.error(f"Erreur extraction annonce: {e}")
+        return None
+
+def _extract_title_parts(parts: List[str]) -> Tuple[Optional[str], Optional[int], Optional[str]]:
+    """Extrait marque, année et modèle des mots du titre (déjà découpé)"""
+    if not parts:
+        return None, None, None
+    
+    
+    # Un seul passage sur les mots: le premier nombre 19xx/20xx est l'année, le reste le modèle
+    year = None
+    model_parts = []
+    for token in parts[1:]:
+        if year is None and len(token) == 4 and token.isdecimal() and token[:2] in ('19', '20'):
+            year = int(token)
+        else:
+            model_parts.append(token)
+    
+    return parts[0], year, ' '.join(model_parts)
+
+def _extract_numeric_price(price_text: str) -> Optional[int]:
+    """Extrait le prix numérique"""
+    try:
+        cleaned = price_text.translate(_KEEP_DIGITS)
+        return int(cleaned) if cleaned else None
+    except:
+        return None
+
+def _extract_details(listing, category: str) -> Tuple[Optional[int], Optional[str], Optional[str]]:
+    """Extrait kilométrage, boîte de vitesse et carburant selon la catégorie"""
+    kilometrage = boite_vitesse = carburant = None
+    # Constant pour toute l'annonce: calculé une fois, hors de la boucle
+    check_gearbox = category in ('voitures', 'location')
+    needed = {'kilometrage', 'carburant', 'boite_vitesse'} if check_gearbox else {'kilometrage', 'carburant'}
+    list_items = listing.css('li')
+    
+    for li in list_items:
+        # Un seul parcours du sous-arbre par <li>, réutilisé par toutes les règles
+        text = li.text(separator=' ', strip=True).lower()
+        if not text:
+            continue
+        
+        for _end, (field, value) in _DETAILS_AUTOMATON.iter(text):
+            if field == 'kilometrage':
+                km = text.translate(_KEEP_DIGITS)
+                if km:
+                    kilometrage = int(km)
+                    needed.discard(field)
+            elif field == 'boite_vitesse':
+                if check_gearbox:
+                    boite_vitesse = value
+                    needed.discard(field)
+            else:
+                carburant = value
+                needed.discard(field)
+        
+        # Tout est trouvé: inutile de parcourir les <li> restants (portes, couleur...)
+        if not needed:
+            break
+    
+    return kilometrage, boite_vitesse, carburant
+
 class DakarAutoScraper:
     
+    category_urls = {
+        'voitures': 'https://dakar-auto.com/senegal/voitures-4',
+        'motos': 'https://dakar-auto.com/senegal/motos-and-scooters-3',
+        'location': 'https://dakar-auto.com/senegal/location-de-voitures-19'
+    }
+    
     def __init__(self):
         self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            # gzip/deflate, plus br si brotli est installé pour le décoder
+            'Accept-Encoding': make_headers(accept_encoding=True)['accept-encoding']
         }
         self.base_url = "https://dakar-auto.com"
+        
+        # Session partagée: les connexions TCP/TLS vers dakar-auto.com sont réutilisées,
+        # et les réponses sont gardées en cache (ETag/Last-Modified respectés)
+        self.session = requests_cache.CachedSession(
+            _CACHE_NAME,
+            backend='sqlite',
+            expire_after=_CACHE_EXPIRE,
+            stale_if_error=True,
+            cache_control=True
+        )
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self._last_request_ts = 0.0
+        
+        # Pool de parsing créé au premier scraping asynchrone, voir _get_process_pool
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._process_pool_lock = threading.Lock()
     
-    def scrape_category(self, url: str, category: str, pages: int = 1) -> pd.DataFrame:
+    def scrape_category(self, url: str, category: str, pages: int = 1,
+                        concurrent: bool = True) -> pd.DataFrame:
+        """Scrape une catégorie; les pages sont téléchargées en parallèle sauf si concurrent=False"""
+        if concurrent:
+            return asyncio.run(self.scrape_category_async(url, category, pages))
         
         all_data = []
         
@@ -27,183 +338,172 @@ class DakarAutoScraper:
             
             try:
                 page_data = self._scrape_single_page(page_url, category)
-                if page_data:
-                    all_data.extend(page_data)
-                    logger.info(f"✓ {len(page_data)} annonces trouvées sur la page {page}")
-                else:
-                    logger.warning(f"Aucune donnée sur la page {page}")
-                
-                
-                if page < pages:
-                    time.sleep(2)
+                self._log_page_result(page, page_data)
+                all_data.extend(page_data)
                     
             except Exception as e:
                 logger.error(f"Erreur sur la page {page}: {e}")
                 continue
         
+        return self._build_dataframe(all_data, category)
+    
+    async def scrape_category_async(self, url: str, category: str, pages: int = 1,
+                                    session: Optional[aiohttp.ClientSession] = None,
+                                    limiter: Optional[AsyncLimiter] = None) -> pd.DataFrame:
+        """Télécharge toutes les pages d'une catégorie en parallèle (4 à la fois au plus)
+        
+        session et limiter peuvent être partagés entre catégories, voir scrape_all_categories_async.
+        """
+        if session is None:
+            async with self._async_session() as session:
+                return await self.scrape_category_async(url, category, pages, session, limiter)
+        
+        logger.info(f"Scraping catégorie: {category}")
+        page_urls = [f"{url}?page={page}" if page > 1 else url for page in range(1, pages + 1)]
+        limiter = limiter or AsyncLimiter(_ASYNC_RATE, 1.0)
+        results = await asyncio.gather(*(
+            self._scrape_page_async(session, limiter, page_url, category)
+            for page_url in page_urls
+        ))
+        
+        all_data = []
+        for page, page_data in enumerate(results, start=1):
+            self._log_page_result(page, page_data)
+            all_data.extend(page_data)
+        
+        return self._build_dataframe(all_data, category)
+    
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Pool de processus pour le parsing CPU-bound, créé à la demande
+        
+        Contexte 'spawn': pas de fork depuis le serveur Streamlit multi-thread. Le pool est
+        arrêté à la sortie de l'interpréteur.
+        """
+        with self._process_pool_lock:
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=os.cpu_count(),
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+                atexit.register(self._process_pool.shutdown, wait=False, cancel_futures=True)
+            return self._process_pool
+    
+    def _discard_process_pool(self, pool: ProcessPoolExecutor):
+        """Oublie un pool cassé (worker tué, OOM) pour que le prochain appel en recrée un"""
+        with self._process_pool_lock:
+            if self._process_pool is pool:
+                self._process_pool = None
+        atexit.unregister(pool.shutdown)
+        pool.shutdown(wait=False, cancel_futures=True)
+    
+    async def _parse_in_pool(self, html: bytes, category: str, url: str) -> List[Tuple]:
+        loop = asyncio.get_running_loop()
+        pool = self._get_process_pool()
+        try:
+            return await loop.run_in_executor(pool, _parse_html, html, category, url)
+        except BrokenProcessPool:
+            # Le scraper vit tout le temps du serveur: sans recréation, tous les scrapings
+            # suivants échoueraient. Une seule nouvelle tentative, l'erreur remonte ensuite
+            logger.warning("Pool de parsing cassé, recréation et nouvel essai")
+            self._discard_process_pool(pool)
+            return await loop.run_in_executor(self._get_process_pool(), _parse_html, html, category, url)
+    
+    def _async_session(self) -> AsyncCachedSession:
+        # limit_per_host: au plus 4 connexions simultanées vers le site, toutes pages confondues
+        return AsyncCachedSession(cache=self._async_cache(), headers=self.headers,
+                                  connector=aiohttp.TCPConnector(limit_per_host=4))
+    
+    def _async_cache(self) -> SQLiteBackend:
+        # Le backend aiosqlite est lié à sa boucle: un nouveau par appel à asyncio.run
+        return SQLiteBackend(f"{_CACHE_NAME}_async", expire_after=_CACHE_EXPIRE,
+                             cache_control=True, autoclose=True)
+    
+    def clear_cache(self):
+        """Vide les caches HTTP des chemins synchrone et asynchrone"""
+        self.session.cache.clear()
+        asyncio.run(self._clear_async_cache())
+    
+    async def _clear_async_cache(self):
+        cache = self._async_cache()
+        await cache.clear()
+        await cache.close()
+    
+    async def _scrape_page_async(self, session: aiohttp.ClientSession, limiter: AsyncLimiter,
+                                 url: str, category: str) -> List[Dict]:
+        """Télécharge une page puis la parse dans un processus pour ne pas bloquer la boucle"""
+        try:
+            html = await self._fetch(session, limiter, url)
+            return await self._parse_in_pool(html, category, url)
+        except Exception as e:
+            logger.error(f"Erreur lors du scraping de {url}: {e}")
+            return []
+    
+    async def _fetch(self, session: aiohttp.ClientSession, limiter: AsyncLimiter, url: str) -> bytes:
+        # Seau à jetons: pas de pause fixe, juste un débit maximal; le connecteur de la
+        # session borne déjà le nombre de requêtes simultanées
+        async with limiter:
+            logger.info(f"Scraping page: {url}")
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                response.raise_for_status()
+                html = await response.read()
+        return html
+    
+    def _log_page_result(self, page: int, page_data: List[Tuple]):
+        if page_data:
+            logger.info(f"✓ {len(page_data)} annonces trouvées sur la page {page}")
+        else:
+            logger.warning(f"Aucune donnée sur la page {page}")
+    
+    def _build_dataframe(self, all_data: List[Tuple], category: str) -> pd.DataFrame:
+        """Construit le DataFrame à schéma fixe, sans inférer les colonnes ligne par ligne"""
         if all_data:
-            df = pd.DataFrame(all_data)
-            df['categorie'] = category
+            df = pd.DataFrame.from_records(all_data, columns=_FIELDS)
+            df[list(_CATEGORY_COLUMNS)] = df[list(_CATEGORY_COLUMNS)].astype('category')
+            for col, dtype in _INT_DTYPES.items():
+                df[col] = to_nullable_int(df[col], dtype)
+            df['categorie'] = pd.Categorical.from_codes(np.zeros(len(df), dtype=np.int8), [category])
             return df
         return pd.DataFrame()
     
-    def _scrape_single_page(self, url: str, category: str) -> List[Dict]:
+    def _wait_min_interval(self):
+        """Attend seulement le reste de _MIN_INTERVAL depuis la dernière requête réseau"""
+        wait = _MIN_INTERVAL - (time.monotonic() - self._last_request_ts)
+        if wait > 0:
+            time.sleep(wait)
+    
+    def _scrape_single_page(self, url: str, category: str) -> List[Tuple]:
         """Scrape une seule page"""
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
+            self._wait_min_interval()
+            # La session en cache lit et copie déjà tout le corps: stream=True n'apporterait rien
+            response = self.session.get(url, timeout=10)
+            # Une réponse servie par le cache n'a rien coûté au site: pas d'attente ensuite
+            if not response.from_cache:
+                self._last_request_ts = time.monotonic()
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-           
-            listings = self._find_listings(soup)
-            
-            data = []
-            for listing in listings:
-                listing_data = self._extract_listing_data(listing, category)
-                if listing_data:
-                    listing_data['url_page'] = url
-                    data.append(listing_data)
-            
-            return data
+            return _parse_html(response.content, category, url)
             
         except Exception as e:
             logger.error(f"Erreur lors du scraping de {url}: {e}")
             return []
     
-    def _find_listings(self, soup: BeautifulSoup):
-        """Trouve tous les conteneurs d'annonces"""
-        
-        selectors = [
-            'div[class*="listing"]',
-            'div[class*="card"]',
-            'article',
-            'div.col-lg-4',
-            'div.col-md-6',
-            'div:has(h2):has(h3)'
-        ]
-        
-        for selector in selectors:
-            listings = soup.select(selector)
-            if len(listings) >= 3:  
-                return listings
-        
-        
-        return soup.find_all(['div', 'article'], 
-                           attrs={'class': lambda x: x and any(
-                               kw in str(x).lower() for kw in ['listing', 'card', 'annonce', 'item']
-                           )})
-    
-    def _extract_listing_data(self, listing, category: str) -> Optional[Dict]:
-        """Extrait les données d'une annonce"""
-        try:
-            data = {}
-            
-           
-            title_elem = listing.find('h2')
-            if not title_elem:
-                return None
-            
-            title = title_elem.get_text(strip=True)
-            data['titre_complet'] = title
-            
-           
-            self._extract_title_parts(title, data)
-            
-            
-            price_elem = listing.find('h3')
-            if price_elem:
-                price_text = price_elem.get_text(strip=True)
-                data['prix_texte'] = price_text
-                data['prix'] = self._extract_numeric_price(price_text)
-            
-            
-            address_elem = price_elem.find_next('p') if price_elem else None
-            if address_elem:
-                data['adresse'] = address_elem.get_text(strip=True)
-            
-            
-            self._extract_details(listing, data, category)
-            
-            return data
-            
-        except Exception as e:
-            logger.error(f"Erreur extraction annonce: {e}")
-            return None
-    
-    def _extract_title_parts(self, title: str, data: Dict):
-        """Extrait marque, modèle et année du titre"""
-        parts = title.split()
-        if parts:
-            data['marque'] = parts[0]
-            
-            
-            year_match = re.search(r'\b(19|20)\d{2}\b', title)
-            if year_match:
-                data['annee'] = year_match.group(0)
-                
-                model_parts = parts[1:]
-                if year_match.group(0) in model_parts:
-                    model_parts.remove(year_match.group(0))
-                data['modele'] = ' '.join(model_parts) if model_parts else ''
-            else:
-                data['annee'] = None
-                data['modele'] = ' '.join(parts[1:]) if len(parts) > 1 else ''
-    
-    def _extract_numeric_price(self, price_text: str) -> Optional[int]:
-        """Extrait le prix numérique"""
-        try:
-            cleaned = re.sub(r'[^\d]', '', price_text)
-            return int(cleaned) if cleaned else None
-        except:
-            return None
+    def scrape_all_categories(self, pages_per_category: int = 1,
+                              categories: Optional[List[str]] = None) -> Dict[str, pd.DataFrame]:
+        """Scrape les catégories demandées (toutes par défaut)"""
+        return asyncio.run(self.scrape_all_categories_async(pages_per_category, categories))
     
-    def _extract_details(self, listing, data: Dict, category: str):
-        """Extrait les détails selon la catégorie"""
-        list_items = listing.find_all('li')
-        
-        for li in list_items:
-            text = li.get_text(strip=True).lower()
-            
-           
-            if 'km' in text:
-                km = re.sub(r'[^\d]', '', text)
-                if km:
-                    data['kilometrage'] = int(km)
-            
-          
-            if category == 'voitures' or category == 'location':
-                if 'automatique' in text:
-                    data['boite_vitesse'] = 'Automatique'
-                elif 'manuelle' in text:
-                    data['boite_vitesse'] = 'Manuelle'
-            
-            
-            if 'diesel' in text:
-                data['carburant'] = 'Diesel'
-            elif 'essence' in text:
-                data['carburant'] = 'Essence'
-        
-        
-        if 'kilometrage' not in data:
-            data['kilometrage'] = None
-        if 'boite_vitesse' not in data and category in ['voitures', 'location']:
-            data['boite_vitesse'] = None
-        if 'carburant' not in data and category == 'voitures':
-            data['carburant'] = None
-    
-    def scrape_all_categories(self, pages_per_category: int = 1) -> Dict[str, pd.DataFrame]:
-        """Scrape toutes les catégories"""
-        categories = {
-            'voitures': 'https://dakar-auto.com/senegal/voitures-4',
-            'motos': 'https://dakar-auto.com/senegal/motos-and-scooters-3',
-            'location': 'https://dakar-auto.com/senegal/location-de-voitures-19'
-        }
+    async def scrape_all_categories_async(self, pages_per_category: int = 1,
+                                          categories: Optional[List[str]] = None) -> Dict[str, pd.DataFrame]:
+        """Scrape les catégories en parallèle, sur une seule session et un seul débit maximal"""
+        if categories is None:
+            categories = list(self.category_urls)
         
-        results = {}
-        for category, url in categories.items():
-            logger.info(f"Scraping catégorie: {category}")
-            df = self.scrape_category(url, category, pages_per_category)
-            if not df.empty:
-                results[category] = df
+        limiter = AsyncLimiter(_ASYNC_RATE, 1.0)
+        async with self._async_session() as session:
+            frames = await asyncio.gather(*(
+                self.scrape_category_async(self.category_urls[category], category,
+                                           pages_per_category, session, limiter)
+                for category in categories
+            ))
         
-        return results
\ No newline at end of file
+        return {category: df for category, df in zip(categories, frames) if not df.empty}
\ No newline at end of file